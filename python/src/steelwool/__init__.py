@@ -1,14 +1,35 @@
+from typing import TYPE_CHECKING
+
 from . import _enums as enums
-from . import _types as types
 
-from ._context_builder import ContextBuilder
-from ._unresolved_response import UnresolvedResponse
+if TYPE_CHECKING:
+    from . import _types as types
+    from ._context_builder import ContextBuilder
+    from ._unresolved_response import UnresolvedResponse
 
 __all__ = [
     # Submodules
-    enums,
-    types,
+    "enums",
+    "types",
     # Objects
-    ContextBuilder,
-    UnresolvedResponse,
+    "ContextBuilder",
+    "UnresolvedResponse",
 ]
+
+
+# PEP 562 lazy loading: everything below drags in pydantic, so defer it
+# until first access. Consumers that only need the enums pay nothing.
+def __getattr__(name: str):
+    if name == "types":
+        from . import _types as types
+
+        return types
+    if name == "ContextBuilder":
+        from ._context_builder import ContextBuilder
+
+        return ContextBuilder
+    if name == "UnresolvedResponse":
+        from ._unresolved_response import UnresolvedResponse
+
+        return UnresolvedResponse
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
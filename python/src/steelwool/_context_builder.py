@@ -1,5 +1,17 @@
-from pydantic import BaseModel, Field
-from typing import Any, AsyncIterator, Awaitable, List, Callable, Self, Optional
+import asyncio
+
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Iterable,
+    List,
+    Callable,
+    Self,
+    Optional,
+    TYPE_CHECKING,
+)
 from ._types import (
     Message,
     PromptResponseDelta,
@@ -8,13 +20,39 @@ from ._types import (
     ToolCall,
     PromptResponse,
     ProviderAdapter,
+    serialize_tools,
 )
 from ._enums import ContentType, StopReason, MessageRole
-from ._unresolved_response import UnresolvedResponse
+
+# _unresolved_response imports ContextBuilder for its model fields, so
+# importing it back at module level would be a circular import; the
+# methods that construct an UnresolvedResponse import it on first use.
+if TYPE_CHECKING:
+    from ._unresolved_response import UnresolvedResponse
+
+# Pre-built model-message template for the streaming path; only
+# `content` varies, so completion fills it in with model_copy.
+_MODEL_MSG_PROTO = Message.model_construct(
+    role=MessageRole.MODEL,
+    content_type=ContentType.TEXT,
+    content="",
+)
 
 
 class ContextBuilder(BaseModel):
-    history: List[Message] = Field(default=[])
+    history: List[Message] = Field(default_factory=list)
+
+    # JSON bytes for each already-serialized history message, with the
+    # messages they were encoded from, so serialized_history only
+    # encodes the tail that grew since the last call and can tell when
+    # the history was rewritten out from under it.
+    _message_bytes: List[bytes] = PrivateAttr(default_factory=list)
+    _message_refs: List[Message] = PrivateAttr(default_factory=list)
+
+    # Snapshot of the last tool list serialized for this conversation
+    # plus its encoded bytes; holding the snapshot keeps the tools
+    # alive, so the cache can never alias a recycled object.
+    _tools_cache: Optional[tuple[List[Tool], bytes]] = PrivateAttr(default=None)
 
     def transform_with(self, transformer: Callable[[Self], Self]) -> Self:
         """
@@ -29,16 +67,73 @@ class ContextBuilder(BaseModel):
         self.history.append(message)
         return self
 
+    def extend_history(self, messages: Iterable[Message]) -> Self:
+        """
+        Pushes several messages into the history in one batch
+        """
+        self.history.extend(messages)
+        return self
+
+    def serialized_history(self) -> bytes:
+        """
+        Serializes the history to a JSON array of messages.
+
+        Uses pydantic-core's Rust serializer and caches per-message
+        bytes, so repeat calls only encode messages appended since the
+        last one instead of re-encoding the whole history. Rewrites
+        (e.g. a pruning transformer dropping or replacing messages)
+        invalidate the cache and trigger a full rebuild. Adapter
+        implementations should build request bodies from this.
+        """
+        history = self.history
+        refs = self._message_refs
+        cache = self._message_bytes
+
+        # Messages are frozen, so identity means the cached bytes are
+        # still right; a shrunk history or swapped prefix message means
+        # the history was rewritten and the cache must start over.
+        if len(history) < len(refs) or any(m is not r for m, r in zip(history, refs)):
+            refs.clear()
+            cache.clear()
+
+        for message in history[len(refs) :]:
+            refs.append(message)
+            cache.append(Message.__pydantic_serializer__.to_json(message))
+
+        return b"[" + b",".join(cache) + b"]"
+
+    def serialized_tools(self, tools: Optional[List[Tool]]) -> bytes:
+        """
+        Serializes a tool list to JSON bytes, memoized per conversation.
+
+        Recursive tool resolution re-sends the same tools every turn;
+        the list compares equal to the cached snapshot (element-wise
+        identity short-circuits), so only the first call pays the
+        schema dump. Adapter implementations should serialize tools
+        through this.
+        """
+        if not tools:
+            return b"[]"
+
+        cached = self._tools_cache
+        if cached is not None and cached[0] == tools:
+            return cached[1]
+
+        data = serialize_tools(tools)
+        self._tools_cache = (list(tools), data)
+        return data
+
     async def send(
         self,
         adapter: ProviderAdapter,
         system_message: str,
         max_tokens: int,
         tools: Optional[List[Tool]],
-    ) -> UnresolvedResponse:
+    ) -> "UnresolvedResponse":
         """
         Send the context to an LLM provider.
         """
+        from ._unresolved_response import UnresolvedResponse
 
         response: PromptResponse = await adapter(
             self, system_message, max_tokens, tools
@@ -51,7 +146,7 @@ class ContextBuilder(BaseModel):
             system_message=system_message,
         )
 
-    async def send_streaming(
+    def send_streaming(
         self,
         adapter: StreamProviderAdapter,
         system_message: str,
@@ -62,7 +157,8 @@ class ContextBuilder(BaseModel):
         Streams a response back from a LLM provider.
 
         This returns the raw `AsyncIterator[PromptResponseDelta]` data
-        from the adapter itself.
+        from the adapter itself, so it can be iterated directly without
+        awaiting an intermediate coroutine first.
         """
         return adapter(self, system_message, max_tokens, tools)
 
@@ -73,41 +169,93 @@ class ContextBuilder(BaseModel):
         max_tokens: int,
         tools: Optional[List[Tool]],
         callback: Callable[[PromptResponseDelta], Awaitable[Any]],
-    ) -> UnresolvedResponse:
+    ) -> "UnresolvedResponse":
+        from ._unresolved_response import UnresolvedResponse
+
         stream = adapter(self, system_message, max_tokens, tools)
 
-        response_content: str = ""
+        # Decouple pulling deltas off the adapter from handling them: a
+        # pump task fills a bounded queue (backpressure at high delta
+        # rates) while this coroutine consumes it, instead of paying
+        # __anext__ protocol overhead inline per delta. A trailing None
+        # marks end-of-stream.
+        queue: asyncio.Queue[Optional[PromptResponseDelta]] = asyncio.Queue(maxsize=64)
+
+        async def _pump() -> None:
+            try:
+                async for delta in stream:
+                    await queue.put(delta)
+            except asyncio.CancelledError:
+                # The consumer cancels the pump only after it has
+                # stopped draining; putting the sentinel into a full
+                # queue here would block this task forever.
+                raise
+            except BaseException:
+                # The consumer is still draining, so space will free
+                # up; it needs the sentinel to stop and surface the
+                # adapter error.
+                await queue.put(None)
+                raise
+            else:
+                await queue.put(None)
+
+        pump_task = asyncio.create_task(_pump())
+
+        # Collect content parts and join once at the end; repeated str
+        # concatenation would copy the whole buffer on every delta.
+        response_parts: List[str] = []
         response_stop_reason: StopReason = StopReason.NULL
         response_token_usage: int = 0
         response_tool_calls: List["ToolCall"] = []
 
-        async for delta in stream:
-            await callback(delta)
+        try:
+            while (delta := await queue.get()) is not None:
+                # Track usage even on otherwise-empty chunks.
+                if delta.cumulative_tokens:
+                    response_token_usage = delta.cumulative_tokens
+
+                # Keep-alive / role-only chunks carry nothing for the
+                # caller; skip the callback's event-loop hop entirely.
+                if not (delta.content or delta.tool_call or delta.stop_reason):
+                    continue
+
+                await callback(delta)
+
+                if delta.content:
+                    response_parts.append(delta.content)
 
-            response_content += delta.content
+                if delta.tool_call:
+                    response_tool_calls.append(delta.tool_call)
 
-            if delta.tool_call:
-                response_tool_calls.append(delta.tool_call)
+                if delta.stop_reason:
+                    response_stop_reason = delta.stop_reason
 
-            if delta.stop_reason:
-                response_stop_reason = delta.stop_reason
+            # Surface any error the adapter raised while streaming.
+            await pump_task
+        finally:
+            pump_task.cancel()
 
-        response_message = Message(
-            role=MessageRole.MODEL,
-            content=response_content,
-            content_type=ContentType.TEXT,
+        response_content = "".join(response_parts)
+
+        # These values were assembled locally from already-validated deltas,
+        # so skip pydantic validation on construction.
+        response_message = _MODEL_MSG_PROTO.model_copy(
+            update={"content": response_content}
         )
 
-        prompt_response = PromptResponse(
+        prompt_response = PromptResponse.model_construct(
             message=response_message,
             stop_reason=response_stop_reason,
             token_usage=response_token_usage,
             tool_calls=response_tool_calls,
         )
 
-        return UnresolvedResponse(
+        return UnresolvedResponse.model_construct(
             prompt_response=prompt_response,
             context_builder=self,
             tools=tools,
             system_message=system_message,
         )
+
+
+__all__ = ["ContextBuilder"]
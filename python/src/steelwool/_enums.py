@@ -1,7 +1,7 @@
 from enum import Enum
 
 
-class MessageRole(Enum):
+class MessageRole(str, Enum):
     USER = "user"
     MODEL = "model"
     FUNCTION = "function"
@@ -9,11 +9,11 @@ class MessageRole(Enum):
     TOOL = "tool"
 
 
-class ContentType(Enum):
+class ContentType(str, Enum):
     TEXT = "text"
 
 
-class StopReason(Enum):
+class StopReason(str, Enum):
     STOP = "stop"
     LENGTH = "length"
     CONTENT_FILTER = "content_filter"
@@ -21,4 +21,4 @@ class StopReason(Enum):
     NULL = "null"
 
 
-__all__ = [MessageRole, ContentType, StopReason]
+__all__ = ["MessageRole", "ContentType", "StopReason"]
@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field
 from typing import (
     AsyncIterator,
     List,
@@ -35,6 +36,8 @@ ToolResolver = Callable[["ToolCall"], Awaitable[str]]
 
 # Represents a single message from an actor in a conversation
 class Message(BaseModel):
+    model_config = ConfigDict(frozen=True, validate_assignment=False, extra="ignore")
+
     role: MessageRole
     content: str
     content_type: ContentType
@@ -42,18 +45,27 @@ class Message(BaseModel):
 
 # Represents a full response
 class PromptResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, validate_assignment=False, extra="ignore")
+
     message: Message
     stop_reason: StopReason
     token_usage: int
-    tool_calls: Optional["ToolCall"] = Field(default=None)
+    tool_calls: Optional[List["ToolCall"]] = Field(default=None)
 
 
 # Represents a chunk of a streaming response
-class PromptResponseDelta(BaseModel):
+#
+# This is a msgspec.Struct rather than a pydantic model: one delta is
+# allocated per streamed token, and struct instantiation skips the
+# validator machinery entirely. Adapters can decode provider bytes
+# straight into it with a single reused decoder from `delta_decoder`
+# below (a bare `msgspec.json.Decoder` can't handle the pydantic
+# `tool_call` field).
+class PromptResponseDelta(msgspec.Struct, frozen=True):
     content: str
-    stop_reason: Optional[StopReason]
-    tool_call: Optional["ToolCall"]
-    cumulative_tokens: int
+    stop_reason: Optional[StopReason] = None
+    tool_call: Optional["ToolCall"] = None
+    cumulative_tokens: int = 0
 
 
 # -------------------- Tools --------------------
@@ -61,6 +73,8 @@ class PromptResponseDelta(BaseModel):
 
 # Defines and describes a tool
 class Tool(BaseModel):
+    model_config = ConfigDict(frozen=True, validate_assignment=False, extra="ignore")
+
     name: str
     description: str
     schema: dict
@@ -69,18 +83,58 @@ class Tool(BaseModel):
 
 # A call to... call a tool!
 class ToolCall(BaseModel):
+    model_config = ConfigDict(frozen=True, validate_assignment=False, extra="ignore")
+
     id: str
     name: str
     arguments: Dict[str, Any]
 
 
+def _delta_dec_hook(target_type: type, obj: Any) -> Any:
+    if target_type is ToolCall:
+        return ToolCall.model_validate(obj)
+    raise NotImplementedError(f"Objects of type {target_type} are not supported")
+
+
+def delta_decoder() -> msgspec.json.Decoder:
+    """
+    Builds a JSON decoder for `PromptResponseDelta`.
+
+    `tool_call` is a pydantic model that msgspec can't decode on its
+    own, so adapters should decode delta bytes through this (one
+    decoder per stream, reused across deltas) instead of constructing
+    a bare `msgspec.json.Decoder`.
+    """
+    return msgspec.json.Decoder(PromptResponseDelta, dec_hook=_delta_dec_hook)
+
+
+def serialize_tools(tools: Optional[List["Tool"]]) -> bytes:
+    """
+    Serializes a tool list to JSON bytes.
+
+    Adapter implementations should prefer `ContextBuilder.serialized_tools`,
+    which memoizes these bytes per conversation instead of re-dumping the
+    schemas on every send.
+    """
+    if not tools:
+        return b"[]"
+
+    # pydantic-core's Rust serializer encodes straight to bytes,
+    # skipping the model_dump -> stdlib-json detour.
+    return (
+        b"[" + b",".join(Tool.__pydantic_serializer__.to_json(t) for t in tools) + b"]"
+    )
+
+
 __all__ = [
-    ProviderAdapter,
-    StreamProviderAdapter,
-    ToolResolver,
-    Message,
-    PromptResponse,
-    PromptResponseDelta,
-    Tool,
-    ToolCall,
+    "ProviderAdapter",
+    "StreamProviderAdapter",
+    "ToolResolver",
+    "Message",
+    "PromptResponse",
+    "PromptResponseDelta",
+    "Tool",
+    "ToolCall",
+    "delta_decoder",
+    "serialize_tools",
 ]
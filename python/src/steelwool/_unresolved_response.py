@@ -1,4 +1,5 @@
-from typing import Awaitable, Callable, List, Optional
+import asyncio
+from typing import Awaitable, Callable, Iterable, List, Optional
 from pydantic import BaseModel, Field
 from ._context_builder import ContextBuilder
 from ._types import (
@@ -6,10 +7,38 @@ from ._types import (
     ProviderAdapter,
     Tool,
     Message,
+    ToolCall,
     ToolResolver,
 )
 from ._enums import ContentType, MessageRole, StopReason
 
+# Pre-built tool-message template; only `content` varies per turn, so
+# the hot paths fill it in with model_copy instead of constructing the
+# constant role/content_type fields every time.
+_TOOL_MSG_PROTO = Message.model_construct(
+    role=MessageRole.TOOL,
+    content_type=ContentType.TEXT,
+    content="",
+)
+
+
+async def _resolve_bounded(
+    tool_resolver: ToolResolver,
+    tool_calls: Iterable[ToolCall],
+    max_concurrent_tools: int,
+) -> List[str]:
+    """
+    Resolves `tool_calls` concurrently, never running more than
+    `max_concurrent_tools` resolvers at once.
+    """
+    sem = asyncio.Semaphore(max_concurrent_tools)
+
+    async def _one(tc: ToolCall) -> str:
+        async with sem:
+            return await tool_resolver(tc)
+
+    return await asyncio.gather(*(_one(tc) for tc in tool_calls))
+
 
 class UnresolvedResponse(BaseModel):
     """
@@ -24,30 +53,41 @@ class UnresolvedResponse(BaseModel):
     tools: Optional[List[Tool]] = Field(default=None)
     system_message: str
 
-    async def resolve_tool_calls(self, tool_resolver: ToolResolver) -> ContextBuilder:
-        self.context_builder.add_message(self.prompt_response.message)
+    async def _build_tool_message(
+        self, tool_resolver: ToolResolver, max_concurrent_tools: int
+    ) -> Message:
+        """
+        Resolves this response's tool calls and assembles their results
+        into a single tool message.
+
+        Tool calls are independent I/O, so they run concurrently, capped
+        so a wide fan-out can't overload downstream services. Non-empty
+        results get newline-joined into the message content.
+        """
+        results = await _resolve_bounded(
+            tool_resolver, self.prompt_response.tool_calls or (), max_concurrent_tools
+        )
+
+        results = [r for r in results if r]
+        tool_response = "\n".join(results) + "\n" if results else ""
 
-        tool_response: str = ""
+        return _TOOL_MSG_PROTO.model_copy(update={"content": tool_response})
 
-        if self.prompt_response.stop_reason != StopReason.TOOL_CALLS:
-            for tc in self.prompt_response.tool_calls:
-                # Call the tool resolver on the tool call
-                result = await tool_resolver(tc)
+    async def resolve_tool_calls(
+        self, tool_resolver: ToolResolver, max_concurrent_tools: int = 8
+    ) -> ContextBuilder:
+        self.context_builder.add_message(self.prompt_response.message)
 
-                # If there is a non-null result, append it to the tool_response
-                # string, and add a new-line afterwards.
-                if result:
-                    tool_response += result + "\n"
+        # Nothing to do on the common no-tools turn; skip building an
+        # empty tool message entirely.
+        if not self.prompt_response.tool_calls:
+            return self.context_builder
 
         self.context_builder.add_message(
-            Message(
-                role=MessageRole.TOOL,
-                content_type=ContentType.TEXT,
-                content=tool_response,
-            )
+            await self._build_tool_message(tool_resolver, max_concurrent_tools)
         )
 
-        return self
+        return self.context_builder
 
     async def resolve_tool_calls_recursively(
         self,
@@ -55,6 +95,7 @@ class UnresolvedResponse(BaseModel):
         tool_reprompt_death: int,
         adapter: ProviderAdapter,
         max_tokens: int,
+        max_concurrent_tools: int = 8,
     ) -> ContextBuilder:
         """
         Recursively resolves tool calls in a model response and feeds results back to the model.
@@ -79,32 +120,32 @@ class UnresolvedResponse(BaseModel):
             if not self.prompt_response.tool_calls:
                 return self.context_builder
 
-            tool_response: str = ""
-
-            for tc in self.prompt_response.tool_calls:
-                result = await tool_resolver(tc)
-
-                if result is not None:
-                    tool_response += result + "\n"
-
-                unresolved_response = await (
-                    self.context_builder.add_message(self.prompt_response.message)
-                    .add_message(
-                        Message(
-                            role=MessageRole.TOOL,
-                            content_type=ContentType.TEXT,
-                            content=tool_response,
-                        )
-                    )
-                    .send(adapter, self.system_message, max_tokens, self.tools)
-                )
-
-                return await unresolved_response.resolve_tool_calls_recursively(
-                    tool_resolver=tool_resolver,
-                    tool_reprompt_death=tool_reprompt_death - 1,
-                    adapter=adapter,
-                    max_tokens=max_tokens - self.prompt_response.token_usage,
-                )
+            # Resolve every tool call before re-prompting, so all results
+            # go back to the model in a single turn instead of one
+            # round-trip per call.
+            tool_message = await self._build_tool_message(
+                tool_resolver, max_concurrent_tools
+            )
+
+            # Push both messages with one raw list.extend; on this hot
+            # recursive path it skips the method hop and pydantic
+            # attribute plumbing that extend_history would re-enter
+            # every turn.
+            self.context_builder.history.extend(
+                (self.prompt_response.message, tool_message)
+            )
+
+            unresolved_response = await self.context_builder.send(
+                adapter, self.system_message, max_tokens, self.tools
+            )
+
+            return await unresolved_response.resolve_tool_calls_recursively(
+                tool_resolver=tool_resolver,
+                tool_reprompt_death=tool_reprompt_death - 1,
+                adapter=adapter,
+                max_tokens=max_tokens - self.prompt_response.token_usage,
+                max_concurrent_tools=max_concurrent_tools,
+            )
 
         elif self.prompt_response.stop_reason == StopReason.NULL:
             raise Exception(
@@ -136,4 +177,4 @@ class UnresolvedResponse(BaseModel):
         return self.context_builder.add_message(self.prompt_response.message)
 
 
-__all__ = [UnresolvedResponse]
+__all__ = ["UnresolvedResponse"]
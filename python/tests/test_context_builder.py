@@ -0,0 +1,69 @@
+from steelwool import ContextBuilder
+from steelwool._enums import ContentType, MessageRole
+from steelwool._types import Message, Tool
+
+
+def _tool(name: str) -> Tool:
+    return Tool(name=name, description=name, schema={}, required=False)
+
+
+def _message(content: str) -> Message:
+    return Message(
+        role=MessageRole.USER, content=content, content_type=ContentType.TEXT
+    )
+
+
+def test_serialized_tools_does_not_alias_recycled_lists():
+    cb = ContextBuilder()
+
+    alpha = [_tool("alpha")]
+    assert b"alpha" in cb.serialized_tools(alpha)
+    del alpha
+
+    beta = [_tool("beta")]
+    data = cb.serialized_tools(beta)
+    assert b"beta" in data
+    assert b"alpha" not in data
+
+
+def test_serialized_tools_reencodes_after_mutation():
+    cb = ContextBuilder()
+
+    tools = [_tool("alpha")]
+    cb.serialized_tools(tools)
+
+    tools.append(_tool("beta"))
+    assert b"beta" in cb.serialized_tools(tools)
+
+
+def test_serialized_tools_caches_unchanged_list():
+    cb = ContextBuilder()
+
+    tools = [_tool("alpha")]
+    first = cb.serialized_tools(tools)
+    assert cb.serialized_tools(tools) is first
+
+
+def test_serialized_history_encodes_appends_incrementally():
+    cb = ContextBuilder().add_message(_message("one"))
+    assert b"one" in cb.serialized_history()
+
+    cb.add_message(_message("two"))
+    data = cb.serialized_history()
+    assert b"one" in data
+    assert b"two" in data
+
+
+def test_serialized_history_rebuilds_after_rewrite():
+    cb = ContextBuilder().add_message(_message("one")).add_message(_message("two"))
+    cb.serialized_history()
+
+    # A pruning transformer rewrites the history wholesale.
+    cb.history.clear()
+    cb.add_message(_message("three"))
+
+    data = cb.serialized_history()
+    assert data.count(b'"content"') == 1
+    assert b"three" in data
+    assert b"one" not in data
+    assert b"two" not in data
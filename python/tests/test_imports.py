@@ -0,0 +1,9 @@
+import steelwool
+
+
+def test_context_builder_resolves():
+    assert steelwool.ContextBuilder.__name__ == "ContextBuilder"
+
+
+def test_unresolved_response_resolves():
+    assert steelwool.UnresolvedResponse.__name__ == "UnresolvedResponse"